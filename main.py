@@ -2,36 +2,52 @@ import argparse
 import os
 import sys
 import threading
-import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
-from rich.console import Console, Group
-from rich.live import Live
+from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from rich.spinner import Spinner
 from rich.table import Table
-from rich.layout import Layout
 from rich import box
 
-from providers import (
-    OpenAIProvider,
-    AnthropicProvider,
-    GeminiProvider,
-    BaseProvider,
-)
+import providers
+from providers import BaseProvider
 
 
 console = Console()
 
+# Snapshot of os.environ so get_provider does plain dict lookups instead of
+# repeated os.getenv scans (refreshed after load_dotenv in main).
+_ENV_CACHE: dict[str, str] = dict(os.environ)
+
+
+def refresh_env_cache() -> None:
+    """Re-snapshot os.environ (call after load_dotenv or env changes)."""
+    _ENV_CACHE.clear()
+    _ENV_CACHE.update(os.environ)
+
+
+# Preallocated mask buffer so mask_api_key slices instead of building "*" * N
+_STARS = "*" * 256
+
 
 def mask_api_key(api_key: str) -> str:
     """Mask API key for display, showing only first 4 and last 4 characters."""
-    if len(api_key) <= 12:
-        return "*" * len(api_key)
-    return f"{api_key[:4]}{'*' * (len(api_key) - 8)}{api_key[-4:]}"
+    n = len(api_key)
+    if n <= 12:
+        return _STARS[:n]
+    middle = _STARS[:n - 8] if n - 8 <= len(_STARS) else "*" * (n - 8)
+    return api_key[:4] + middle + api_key[-4:]
+
+
+def _truncate(s: Optional[str], n: int = 50, suffix: str = "...") -> Optional[str]:
+    """Truncate a string to n characters, appending a suffix when cut."""
+    if not s or len(s) <= n:
+        return s
+    return s[:n - len(suffix)] + suffix
 
 
 def display_provider_info(provider: BaseProvider) -> None:
@@ -53,6 +69,36 @@ def display_provider_info(provider: BaseProvider) -> None:
     console.print()
 
 
+# Valid provider names, shared by both subparsers' choices
+_PROVIDER_CHOICES: tuple[str, ...] = ("openai", "anthropic", "gemini")
+
+# Provider class names (resolved lazily through the providers package) and
+# the env vars holding their key/url/system-prompt/default-model settings
+_PROVIDER_REGISTRY: dict[str, tuple[str, str, Optional[str], str, str]] = {
+    "openai": (
+        "OpenAIProvider",
+        "OPENAI_API_KEY",
+        "OPENAI_BASE_URL",
+        "OPENAI_SYSTEM_PROMPT",
+        "OPENAI_DEFAULT_MODEL",
+    ),
+    "anthropic": (
+        "AnthropicProvider",
+        "ANTHROPIC_API_KEY",
+        "ANTHROPIC_BASE_URL",
+        "ANTHROPIC_SYSTEM_PROMPT",
+        "ANTHROPIC_DEFAULT_MODEL",
+    ),
+    "gemini": (
+        "GeminiProvider",
+        "GEMINI_API_KEY",
+        None,  # Gemini doesn't support custom base_url in SDK
+        "GEMINI_SYSTEM_PROMPT",
+        "GEMINI_DEFAULT_MODEL",
+    ),
+}
+
+
 def get_provider(
     provider_name: str,
     api_key: Optional[str] = None,
@@ -61,45 +107,23 @@ def get_provider(
     default_model: Optional[str] = None,
 ) -> BaseProvider:
     """Get provider instance by name."""
-    providers = {
-        "openai": (
-            OpenAIProvider,
-            "OPENAI_API_KEY",
-            "OPENAI_BASE_URL",
-            "OPENAI_SYSTEM_PROMPT",
-            "OPENAI_DEFAULT_MODEL",
-        ),
-        "anthropic": (
-            AnthropicProvider,
-            "ANTHROPIC_API_KEY",
-            "ANTHROPIC_BASE_URL",
-            "ANTHROPIC_SYSTEM_PROMPT",
-            "ANTHROPIC_DEFAULT_MODEL",
-        ),
-        "gemini": (
-            GeminiProvider,
-            "GEMINI_API_KEY",
-            None,  # Gemini doesn't support custom base_url in SDK
-            "GEMINI_SYSTEM_PROMPT",
-            "GEMINI_DEFAULT_MODEL",
-        ),
-    }
-
-    if provider_name not in providers:
+    if provider_name not in _PROVIDER_REGISTRY:
         raise ValueError(f"Unknown provider: {provider_name}")
 
-    provider_class, key_env, url_env, system_env, model_env = providers[provider_name]
+    class_name, key_env, url_env, system_env, model_env = _PROVIDER_REGISTRY[provider_name]
+    # Resolve the class lazily so only the requested SDK gets imported
+    provider_class = getattr(providers, class_name)
 
-    # Use provided values or fall back to environment variables
-    final_api_key = api_key or os.getenv(key_env)
-    final_base_url = base_url or (os.getenv(url_env) if url_env else None)
-    final_system_prompt = system_prompt or os.getenv(system_env)
-    final_default_model = default_model or os.getenv(model_env)
+    # Use provided values or fall back to the cached environment snapshot
+    final_api_key = api_key or _ENV_CACHE.get(key_env)
+    final_base_url = base_url or (_ENV_CACHE.get(url_env) if url_env else None)
+    final_system_prompt = system_prompt or _ENV_CACHE.get(system_env)
+    final_default_model = default_model or _ENV_CACHE.get(model_env)
 
     if not final_api_key:
         raise ValueError(f"API key not provided for {provider_name}. Set {key_env} in .env or use --api-key")
 
-    return provider_class(
+    return provider_class.get_instance(
         api_key=final_api_key,
         base_url=final_base_url,
         system_prompt=final_system_prompt,
@@ -124,15 +148,17 @@ def display_models(provider: BaseProvider) -> None:
         table.add_column("Name", style="yellow")
         table.add_column("Description", style="white", max_width=50)
 
-        for model in models:
-            table.add_row(
-                model.id,
-                model.name or "-",
-                (model.description[:47] + "...") if model.description and len(model.description) > 50 else (model.description or "-"),
-            )
+        # Extract the row tuples in a list comprehension (C-level loop) so the
+        # Python-level loop is just the add_row calls
+        rows = [
+            (model.id, model.name or "-", _truncate(model.description) or "-")
+            for model in models
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
-        console.print(f"\n[bold green]Total: {len(models)} models[/bold green]")
+        console.print(f"\n[bold green]Total: {len(rows)} models[/bold green]")
 
     except Exception as e:
         console.print(Panel(
@@ -164,6 +190,136 @@ def validate_key(provider: BaseProvider) -> None:
         sys.exit(1)
 
 
+def validate_all_providers() -> None:
+    """Validate API keys for all configured providers in parallel."""
+    from rich.live import Live
+
+    providers = []
+    for name in ["openai", "anthropic", "gemini"]:
+        try:
+            providers.append(get_provider(name))
+        except ValueError as e:
+            console.print(Panel(
+                f"[yellow]{str(e)}[/yellow]",
+                title="Warning",
+                border_style="yellow",
+            ))
+
+    if not providers:
+        console.print(Panel(
+            "[bold red]No providers available. Check your .env configuration.[/bold red]",
+            title="Error",
+            border_style="red",
+        ))
+        sys.exit(1)
+
+    # None = still checking, True/False = validation result
+    results: dict[str, Optional[bool]] = {p.name: None for p in providers}
+
+    def build_table() -> Table:
+        table = Table(
+            title="[bold blue]API Key Validation[/bold blue]",
+            box=box.ROUNDED,
+            show_header=True,
+            header_style="bold cyan",
+        )
+        table.add_column("Provider", style="magenta")
+        table.add_column("API Key", style="yellow")
+        table.add_column("Status")
+
+        for p in providers:
+            status = results[p.name]
+            if status is None:
+                status_text = "[cyan]Checking...[/cyan]"
+            elif status:
+                status_text = "[bold green]Valid[/bold green]"
+            else:
+                status_text = "[bold red]Invalid[/bold red]"
+            table.add_row(p.name, mask_api_key(p.api_key), status_text)
+
+        return table
+
+    # Validation is I/O-bound, so fan out the three round-trips in threads
+    with Live(build_table(), console=console, refresh_per_second=10) as live:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {executor.submit(p.validate_key): p for p in providers}
+            for future in as_completed(futures):
+                provider = futures[future]
+                results[provider.name] = future.result()
+                live.update(build_table())
+
+    if not all(results.values()):
+        sys.exit(1)
+
+
+def bulk_validate_keys(max_concurrency: int = 100) -> None:
+    """Validate provider/key pairs read from stdin, with async fan-out.
+
+    Each line is "<provider> <api_key>"; blank lines and #-comments are
+    skipped. Results print in input order once the whole batch finishes.
+    """
+    import asyncio
+
+    items: list[tuple[str, str]] = []
+    for lineno, line in enumerate(sys.stdin, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split()
+        if len(parts) != 2 or parts[0] not in _PROVIDER_CHOICES:
+            # Don't echo the line itself: a malformed entry usually still
+            # contains an API key, which must never print unmasked
+            console.print(f"[yellow]Skipping malformed line {lineno}[/yellow]")
+            continue
+        items.append((parts[0], parts[1]))
+
+    if not items:
+        console.print(Panel(
+            "[bold red]No keys on stdin. Pipe lines of \"<provider> <api_key>\".[/bold red]",
+            title="Error",
+            border_style="red",
+        ))
+        sys.exit(1)
+
+    # uvloop's C event loop roughly doubles high-concurrency I/O throughput;
+    # it is optional (and unavailable on Windows), so fall back silently
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    results = asyncio.run(
+        providers.validate_many(items, max_concurrency=max_concurrency)
+    )
+
+    table = Table(
+        title="[bold blue]Bulk Key Validation[/bold blue]",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold cyan",
+    )
+    table.add_column("Provider", style="magenta")
+    table.add_column("API Key", style="yellow")
+    table.add_column("Status")
+
+    valid = 0
+    for (kind, api_key), result in zip(items, results):
+        if isinstance(result, BaseException):
+            status = f"[bold red]Error: {_truncate(str(result))}[/bold red]"
+        elif result:
+            status = "[bold green]Valid[/bold green]"
+            valid += 1
+        else:
+            status = "[bold red]Invalid[/bold red]"
+        table.add_row(kind, mask_api_key(api_key), status)
+
+    console.print(table)
+    console.print(f"\n[bold]{valid}/{len(items)} keys valid[/bold]")
+    if valid < len(items):
+        sys.exit(1)
+
+
 def create_response_panel(provider_name: str, content: str, done: bool = False) -> Panel:
     """Create a panel for streaming response."""
     title = f"[bold]{provider_name}[/bold]"
@@ -192,16 +348,20 @@ def chat_single_provider(
         tuple of (provider_name, content, success)
     """
     try:
-        content = ""
+        chunks = []
         for chunk in provider.chat(message, model=model, system_prompt=system_prompt, stream=True):
-            content += chunk
-        return (provider.name, content, True)
+            chunks.append(chunk)
+        return (provider.name, "".join(chunks), True)
     except Exception as e:
         return (provider.name, f"Error: {str(e)}", False)
 
 
 def chat_all_providers(message: str, provider_name: Optional[str] = None, model: Optional[str] = None, system_prompt: Optional[str] = None) -> None:
     """Chat with all providers simultaneously and display results with Rich."""
+    # Only the chat view needs these rich submodules; keep them off the
+    # cold-start path of the list/validate commands
+    from rich.live import Live
+    from rich.layout import Layout
 
     provider_names = [provider_name] if provider_name else ["openai", "anthropic", "gemini"]
 
@@ -225,11 +385,23 @@ def chat_all_providers(message: str, provider_name: Optional[str] = None, model:
         ))
         sys.exit(1)
 
-    # Initialize empty content for each provider
-    provider_contents = {p.name: "" for p in providers}
+    # Accumulate streamed chunks per provider; joined once per render instead
+    # of growing a string per chunk (quadratic for long responses)
+    provider_contents: dict[str, list[str]] = {p.name: [] for p in providers}
     provider_done = {p.name: False for p in providers}
     provider_model = {p.name: model or p.default_model or "(default)" for p in providers}
 
+    # Panel titles only vary in the status suffix, so render both variants
+    # once instead of rebuilding the f-string on every refresh tick
+    title_generating = {
+        p.name: f"[bold]{p.name}[/bold] [cyan][[/cyan][yellow]{provider_model[p.name]}[/yellow][cyan]][/cyan] [cyan]Generating...[/cyan]"
+        for p in providers
+    }
+    title_done = {
+        p.name: f"[bold]{p.name}[/bold] [cyan][[/cyan][yellow]{provider_model[p.name]}[/yellow][cyan]][/cyan] [bold green](done)[/bold green]"
+        for p in providers
+    }
+
     def truncate_content_for_streaming(content: str, max_lines: int = 12) -> str:
         """Truncate content to show only the last N lines during streaming."""
         lines = content.split('\n')
@@ -251,12 +423,12 @@ def chat_all_providers(message: str, provider_name: Optional[str] = None, model:
 
         # Update each section with provider panel
         for idx, provider in enumerate(providers):
-            status = "[bold green](done)[/bold green]" if provider_done[provider.name] else "[cyan]Generating...[/cyan]"
-            border = "green" if provider_done[provider.name] else "blue"
-            title = f"[bold]{provider.name}[/bold] [cyan][[/cyan][yellow]{provider_model[provider.name]}[/yellow][cyan]][/cyan] {status}"
+            done = provider_done[provider.name]
+            border = "green" if done else "blue"
+            title = title_done[provider.name] if done else title_generating[provider.name]
 
             # Truncate content for streaming view
-            display_content = truncate_content_for_streaming(provider_contents[provider.name])
+            display_content = truncate_content_for_streaming("".join(provider_contents[provider.name]))
 
             panel = Panel(
                 Text(display_content, style="white"),
@@ -269,16 +441,23 @@ def chat_all_providers(message: str, provider_name: Optional[str] = None, model:
 
         return layout
 
+    # Wakes the render loop when a chunk arrives instead of polling at a
+    # fixed rate, so idle streams don't burn CPU on redundant redraws
+    refresh = threading.Condition()
+
     def run_provider(provider: BaseProvider) -> None:
         """Run chat for a single provider in a thread."""
         try:
-            content = ""
             for chunk in provider.chat(message, model=model, system_prompt=system_prompt, stream=True):
-                provider_contents[provider.name] += chunk
+                provider_contents[provider.name].append(chunk)
+                with refresh:
+                    refresh.notify()
             provider_done[provider.name] = True
         except Exception as e:
-            provider_contents[provider.name] = f"Error: {str(e)}"
+            provider_contents[provider.name] = [f"Error: {str(e)}"]
             provider_done[provider.name] = True
+        with refresh:
+            refresh.notify()
 
     # Start all providers in parallel threads
     threads = []
@@ -288,21 +467,20 @@ def chat_all_providers(message: str, provider_name: Optional[str] = None, model:
         threads.append(t)
 
     # Display with Live for streaming updates (fixed-height split screen)
-    with Live(create_streaming_layout(), console=console, refresh_per_second=20, screen=True) as live:
+    with Live(create_streaming_layout(), console=console, auto_refresh=False, screen=True) as live:
         while not all(provider_done.values()):
-            live.update(create_streaming_layout())
-            time.sleep(0.05)
+            with refresh:
+                refresh.wait(timeout=0.1)
+            live.update(create_streaming_layout(), refresh=True)
         for t in threads:
             t.join()
-        # Final update for streaming view
-        live.update(create_streaming_layout())
 
     # After streaming is done, show full content
     console.print("\n[bold cyan]═══ Full Output ═══[/bold cyan]\n")
     for provider in providers:
-        title = f"[bold]{provider.name}[/bold] [cyan][[/cyan][yellow]{provider_model[provider.name]}[/yellow][cyan]][/cyan] [bold green](done)[/bold green]"
+        title = title_done[provider.name]
         console.print(Panel(
-            Text(provider_contents[provider.name], style="white"),
+            Text("".join(provider_contents[provider.name]), style="white"),
             title=title,
             border_style="green",
             expand=True,
@@ -310,9 +488,8 @@ def chat_all_providers(message: str, provider_name: Optional[str] = None, model:
         ))
 
 
-def main():
-    load_dotenv()
-
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (constructed once at import)."""
     parser = argparse.ArgumentParser(
         description="Multi-provider AI CLI tool for OpenAI, Anthropic, and Gemini",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -324,6 +501,12 @@ Examples:
   uv run main.py list gemini --api-key YOUR_KEY # Use custom API key
   uv run main.py list openai --base-url https://custom.api.com/v1
 
+  # Validate all configured keys in parallel
+  uv run main.py validate-all
+
+  # Bulk-validate "<provider> <api_key>" lines from stdin
+  cat keys.txt | uv run main.py bulk
+
   # Chat with providers
   uv run main.py chat "Hello, how are you?"     # Chat with all providers simultaneously
   uv run main.py chat "Tell me a joke" -m gpt-4o  # Use specific model
@@ -343,7 +526,7 @@ Environment variables (.env):
     list_parser = subparsers.add_parser("list", help="List models for a provider")
     list_parser.add_argument(
         "provider",
-        choices=["openai", "anthropic", "gemini"],
+        choices=_PROVIDER_CHOICES,
         help="API provider to check",
     )
     list_parser.add_argument(
@@ -363,16 +546,36 @@ Environment variables (.env):
         help="Only validate the API key without listing models",
     )
 
+    # Parallel key validation command
+    subparsers.add_parser(
+        "validate-all",
+        help="Validate API keys for all configured providers in parallel",
+    )
+
+    # Bulk stdin-driven key validation command
+    bulk_parser = subparsers.add_parser(
+        "bulk",
+        help="Validate \"<provider> <api_key>\" lines from stdin concurrently",
+    )
+    bulk_parser.add_argument(
+        "--max-concurrency",
+        "-c",
+        type=int,
+        default=100,
+        help="Maximum simultaneous validation requests (default: 100)",
+    )
+
     # Chat command
     chat_parser = subparsers.add_parser("chat", help="Chat with all providers simultaneously")
     chat_parser.add_argument(
         "message",
+        nargs="?",
         help="Message to send to all providers",
     )
     chat_parser.add_argument(
         "--provider",
         "-p",
-        choices=["openai", "anthropic", "gemini"],
+        choices=_PROVIDER_CHOICES,
         help="Specific provider to chat with (default: all providers)",
     )
     chat_parser.add_argument(
@@ -386,9 +589,33 @@ Environment variables (.env):
         help="System prompt (overrides .env system prompt)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+@lru_cache(maxsize=1)
+def get_args() -> argparse.Namespace:
+    """Parse command-line arguments (memoized for repeated main() calls)."""
+    return _PARSER.parse_args()
+
+
+def main():
+    load_dotenv()
+    refresh_env_cache()
+    providers.install_fast_json()
+
+    args = get_args()
 
     if args.command == "chat":
+        if not args.message:
+            console.print(Panel(
+                "[bold red]No message provided. Usage: chat \"your message\"[/bold red]",
+                title="Error",
+                border_style="red",
+            ))
+            sys.exit(1)
         # Chat mode - talk to all providers simultaneously
         chat_all_providers(
             message=args.message,
@@ -396,6 +623,12 @@ Environment variables (.env):
             model=args.model,
             system_prompt=args.system_prompt,
         )
+    elif args.command == "validate-all":
+        # Validate all configured keys in parallel
+        validate_all_providers()
+    elif args.command == "bulk":
+        # Bulk-validate keys piped on stdin
+        bulk_validate_keys(max_concurrency=args.max_concurrency)
     else:
         # List mode (default)
         provider_name = args.provider if args.command == "list" else args.provider
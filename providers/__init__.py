@@ -1,7 +1,12 @@
 from .base import BaseProvider, ModelInfo
-from .openai_provider import OpenAIProvider
-from .anthropic_provider import AnthropicProvider
-from .gemini_provider import GeminiProvider
+
+# Provider classes are resolved lazily (PEP 562) so importing this package
+# does not pull in every SDK; each SDK loads only when its provider is used.
+_PROVIDER_MODULES = {
+    "OpenAIProvider": ".openai_provider",
+    "AnthropicProvider": ".anthropic_provider",
+    "GeminiProvider": ".gemini_provider",
+}
 
 __all__ = [
     "BaseProvider",
@@ -9,4 +14,29 @@ __all__ = [
     "OpenAIProvider",
     "AnthropicProvider",
     "GeminiProvider",
+    "install_fast_json",
+    "validate_keys",
+    "validate_many",
+    "make_provider",
+    "BatchingExecutor",
 ]
+
+
+async def validate_keys(providers: list[BaseProvider]) -> list[bool]:
+    """Validate keys for the given providers concurrently."""
+    import asyncio
+    return await asyncio.gather(*(p.avalidate_key() for p in providers))
+
+
+def __getattr__(name: str):
+    if name == "install_fast_json":
+        from ._json import install_fast_json
+        return install_fast_json
+    if name in ("validate_many", "make_provider", "BatchingExecutor"):
+        from importlib import import_module
+        return getattr(import_module(".batch", __name__), name)
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(module_name, __name__), name)
@@ -0,0 +1,31 @@
+"""Shared HTTP connection pools for the provider SDK clients."""
+
+import atexit
+
+import httpx
+
+# One pool per process; the SDKs build requests with absolute URLs, so
+# clients for different providers can share the same transport and its
+# keep-alive sockets instead of each opening their own.
+_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=30,
+)
+
+SHARED_HTTP_CLIENT = httpx.Client(limits=_LIMITS)
+SHARED_ASYNC_CLIENT = httpx.AsyncClient(limits=_LIMITS)
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    """Release the shared pools at interpreter shutdown."""
+    try:
+        SHARED_HTTP_CLIENT.close()
+    except Exception:
+        pass
+    try:
+        import asyncio
+        asyncio.run(SHARED_ASYNC_CLIENT.aclose())
+    except Exception:
+        pass
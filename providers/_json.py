@@ -0,0 +1,39 @@
+"""Optional orjson-backed JSON decoding for the provider SDKs."""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+#: Fastest available JSON decoder, for callers parsing payloads directly.
+loads = orjson.loads if orjson is not None else json.loads
+
+_installed = False
+
+
+def install_fast_json() -> None:
+    """Decode SDK HTTP responses with orjson when available.
+
+    All three SDKs parse their responses (model listings, completions)
+    through httpx's Response.json, which uses stdlib json. orjson decodes
+    the same payloads several times faster, so this patches Response.json
+    to route through orjson.loads. Calls passing json.loads keyword
+    arguments keep the stdlib path; no-op when orjson is not installed.
+    """
+    global _installed
+    if orjson is None or _installed:
+        return
+
+    import httpx
+
+    stdlib_json = httpx.Response.json
+
+    def fast_json(self, **kwargs):
+        if kwargs:
+            return stdlib_json(self, **kwargs)
+        return orjson.loads(self.content)
+
+    httpx.Response.json = fast_json
+    _installed = True
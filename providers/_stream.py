@@ -0,0 +1,17 @@
+"""Shared accumulate-and-yield helper for streaming chat responses."""
+
+from typing import Generator, Iterable
+
+
+def pump(deltas: Iterable[str]) -> Generator[str, None, str]:
+    """Yield each delta while accumulating; return the joined response.
+
+    Providers delegate their streaming loops here with ``yield from`` so
+    the accumulate/yield state machine lives in one place and each
+    provider only supplies an iterable of text deltas.
+    """
+    parts = []
+    for delta in deltas:
+        parts.append(delta)
+        yield delta
+    return "".join(parts)
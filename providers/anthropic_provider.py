@@ -1,54 +1,89 @@
-from typing import Optional, Generator
+from functools import cached_property
+from typing import AsyncIterator, ClassVar, Optional, Generator, Iterator
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
+from ._http import SHARED_ASYNC_CLIENT, SHARED_HTTP_CLIENT
+from ._stream import pump
 from .base import BaseProvider, ModelInfo
 
 
 class AnthropicProvider(BaseProvider):
     """Anthropic API provider."""
 
-    def __init__(
-        self,
-        api_key: str,
-        base_url: Optional[str] = None,
-        system_prompt: Optional[str] = None,
-        default_model: Optional[str] = None,
-    ):
-        super().__init__(api_key, base_url, system_prompt, default_model)
-        self._client: Optional[Anthropic] = None
+    name = "Anthropic"
+    api_root = "https://api.anthropic.com/v1/models"
 
-    @property
-    def name(self) -> str:
-        return "Anthropic"
+    # SDK clients shared per credentials, so repeated construction with the
+    # same key reuses the existing connection pool and TLS session
+    _client_cache: ClassVar[dict[tuple, Anthropic]] = {}
+    _aclient_cache: ClassVar[dict[tuple, AsyncAnthropic]] = {}
 
-    @property
+    @cached_property
     def client(self) -> Anthropic:
-        if self._client is None:
-            kwargs = {"api_key": self.api_key}
+        cache_key = (self.api_key, self.base_url)
+        client = self._client_cache.get(cache_key)
+        if client is None:
+            kwargs = {"api_key": self.api_key, "http_client": SHARED_HTTP_CLIENT}
             if self.base_url:
                 kwargs["base_url"] = self.base_url
-            self._client = Anthropic(**kwargs)
-        return self._client
+            client = Anthropic(**kwargs)
+            self._client_cache[cache_key] = client
+        return client
 
-    def list_models(self) -> list[ModelInfo]:
-        """List all available models from Anthropic."""
-        models = []
+    @cached_property
+    def aclient(self) -> AsyncAnthropic:
+        cache_key = (self.api_key, self.base_url)
+        client = self._aclient_cache.get(cache_key)
+        if client is None:
+            kwargs = {"api_key": self.api_key, "http_client": SHARED_ASYNC_CLIENT}
+            if self.base_url:
+                kwargs["base_url"] = self.base_url
+            client = AsyncAnthropic(**kwargs)
+            self._aclient_cache[cache_key] = client
+        return client
+
+    def _fetch_models(self) -> Iterator[ModelInfo]:
+        """Yield available models from Anthropic as pages arrive."""
         for model in self.client.models.list():
+            created_at = getattr(model, "created_at", None)
+            yield ModelInfo(
+                id=model.id,
+                name=getattr(model, "display_name", None) or model.id,
+                description=getattr(model, "description", None),
+                created=int(created_at.timestamp()) if created_at else None,
+            )
+
+    async def alist_models(self) -> list[ModelInfo]:
+        """Async variant of list_models, returning the full list."""
+        models = []
+        async for model in self.aclient.models.list():
+            created_at = getattr(model, "created_at", None)
             models.append(
                 ModelInfo(
                     id=model.id,
-                    name=model.display_name if hasattr(model, "display_name") else model.id,
+                    name=getattr(model, "display_name", None) or model.id,
                     description=getattr(model, "description", None),
-                    created=int(model.created_at.timestamp()) if hasattr(model, "created_at") and model.created_at else None,
+                    created=int(created_at.timestamp()) if created_at else None,
                 )
             )
         return models
 
-    def validate_key(self) -> bool:
-        """Validate the API key by attempting to list models."""
+    def _check_credentials(self) -> bool:
+        """Check the API key by fetching at most one model."""
         try:
-            self.list_models()
+            # Consuming a single item only pulls the first page, instead of
+            # materializing the full paginated model list
+            next(iter(self.client.models.list()), None)
+            return True
+        except Exception:
+            return False
+
+    async def _acheck_credentials(self) -> bool:
+        """Async variant of _check_credentials."""
+        try:
+            async for _ in self.aclient.models.list():
+                break
             return True
         except Exception:
             return False
@@ -67,32 +102,77 @@ class AnthropicProvider(BaseProvider):
         if not model:
             raise ValueError("No model specified and no default model set")
 
-        # Build messages
-        messages = []
-        if system_prompt or self.system_prompt:
-            messages.append({"role": "user", "content": f"{system_prompt or self.system_prompt}\n\n{message}"})
-        else:
-            messages.append({"role": "user", "content": message})
+        # Pass the system prompt through the native system= parameter so it
+        # keeps its role (and server-side prompt-cache eligibility) instead
+        # of being concatenated into the user message
+        kwargs = {
+            "model": model,
+            "max_tokens": 4096,
+            "messages": [{"role": "user", "content": message}],
+        }
+        sp = system_prompt or self.system_prompt
+        if sp:
+            kwargs["system"] = sp
 
         if stream:
-            with self.client.messages.stream(
-                model=model,
-                max_tokens=4096,
-                messages=messages,
-            ) as stream_response:
-                content = ""
-                for chunk in stream_response:
-                    if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta":
-                        chunk_content = chunk.delta.text
-                        content += chunk_content
-                        yield chunk_content
-            return content
+            with self.client.messages.stream(**kwargs) as stream_response:
+                return (yield from pump(
+                    chunk.delta.text
+                    for chunk in stream_response
+                    if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta"
+                ))
         else:
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=4096,
-                messages=messages,
-            )
+            response = self.client.messages.create(**kwargs)
             if response.content and len(response.content) > 0:
                 return response.content[0].text or ""
             return ""
+
+    async def achat(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Async, non-streaming variant of chat."""
+        model = model or self.default_model
+        if not model:
+            raise ValueError("No model specified and no default model set")
+
+        kwargs = {
+            "model": model,
+            "max_tokens": 4096,
+            "messages": [{"role": "user", "content": message}],
+        }
+        sp = system_prompt or self.system_prompt
+        if sp:
+            kwargs["system"] = sp
+
+        response = await self.aclient.messages.create(**kwargs)
+        if response.content and len(response.content) > 0:
+            return response.content[0].text or ""
+        return ""
+
+    async def astream(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Async streaming variant of chat, yielding response deltas."""
+        model = model or self.default_model
+        if not model:
+            raise ValueError("No model specified and no default model set")
+
+        kwargs = {
+            "model": model,
+            "max_tokens": 4096,
+            "messages": [{"role": "user", "content": message}],
+        }
+        sp = system_prompt or self.system_prompt
+        if sp:
+            kwargs["system"] = sp
+
+        async with self.aclient.messages.stream(**kwargs) as stream_response:
+            async for chunk in stream_response:
+                if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta":
+                    yield chunk.delta.text
@@ -1,9 +1,25 @@
+import hashlib
+import time
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Generator
+from typing import Optional, Generator, Iterator
 
+# Validation results keyed on (provider, key digest, base_url, time bucket);
+# the bucket rotates every _VALIDATION_TTL seconds, expiring old entries
+_VALIDATION_CACHE: dict[tuple, bool] = {}
+_VALIDATION_TTL = 300.0
 
-@dataclass
+# Model catalogs keyed on (provider, key digest, base_url); each entry
+# stores its own expiry so a UI refresh within the TTL skips the re-download
+_MODELS_CACHE: dict[tuple, tuple[float, list["ModelInfo"]]] = {}
+_MODELS_TTL = 300.0
+
+# Interned provider instances, alive only while callers hold a reference
+_INSTANCES: "weakref.WeakValueDictionary[tuple, BaseProvider]" = weakref.WeakValueDictionary()
+
+
+@dataclass(slots=True, frozen=True)
 class ModelInfo:
     """Unified model information structure."""
     id: str
@@ -12,7 +28,7 @@ class ModelInfo:
     created: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatMessage:
     """Unified chat message structure."""
     role: str  # "system", "user", "assistant"
@@ -22,6 +38,45 @@ class ChatMessage:
 class BaseProvider(ABC):
     """Base class for API providers."""
 
+    #: Provider display name; subclasses override with a plain class
+    #: attribute so hot-path lookups skip the descriptor protocol.
+    name: str = ""
+
+    #: API root used by prewarm() to open a keep-alive connection early.
+    api_root: str = ""
+
+    @classmethod
+    def prewarm(cls) -> None:
+        """Open a keep-alive connection to the provider's API host.
+
+        Long-lived embedders can call this at startup so the first real
+        request skips the TCP and TLS handshake; the response itself is
+        discarded and errors are ignored. No-op without an api_root.
+        """
+        if not cls.api_root:
+            return
+        from ._http import SHARED_HTTP_CLIENT
+        try:
+            SHARED_HTTP_CLIENT.head(cls.api_root, timeout=5.0)
+        except Exception:
+            pass
+
+    @classmethod
+    def get_instance(cls, api_key: str, **options) -> "BaseProvider":
+        """Return an interned instance for these credentials and options.
+
+        Constructing a provider repeatedly for the same key re-runs client
+        setup each time; this factory hands back the existing instance when
+        one is still alive. Instances are held weakly, so they go away with
+        their last caller.
+        """
+        key = (cls, api_key, frozenset(options.items()))
+        inst = _INSTANCES.get(key)
+        if inst is None:
+            inst = cls(api_key=api_key, **options)
+            _INSTANCES[key] = inst
+        return inst
+
     def __init__(
         self,
         api_key: str,
@@ -34,20 +89,120 @@ class BaseProvider(ABC):
         self.system_prompt = system_prompt
         self.default_model = default_model
 
-    @property
+    def close(self) -> None:
+        """Drop this instance's cached SDK clients.
+
+        Long-running embedders can call this (or use the provider as a
+        context manager) so clients for retired keys are garbage-collected
+        instead of accumulating in the per-class caches. The shared httpx
+        pools stay open — they are process-wide, bounded by the pool
+        limits, and closed atexit — so in-flight requests on other
+        providers are unaffected.
+        """
+        for attr in ("client", "aclient"):
+            self.__dict__.pop(attr, None)
+        # Per-class caches key on the bare api_key (Gemini) or on
+        # (api_key, base_url); evict both shapes
+        for cache_name in ("_client_cache", "_aclient_cache"):
+            cache = getattr(type(self), cache_name, None)
+            if cache is not None:
+                cache.pop(self.api_key, None)
+                cache.pop((self.api_key, self.base_url), None)
+
+    def __enter__(self) -> "BaseProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            # Interpreter shutdown may have torn down our globals already
+            pass
+
+    def list_models(self, refresh: bool = False) -> Iterator[ModelInfo]:
+        """Yield available models, serving repeats from a short-lived cache.
+
+        The full catalog runs to dozens of KB of JSON; within the TTL a
+        second enumeration replays the cached list instead of re-fetching.
+        Keys are stored as blake2b digests, matching validate_key; pass
+        refresh=True to force a fresh download.
+        """
+        digest = hashlib.blake2b(self.api_key.encode(), digest_size=16).digest()
+        cache_key = (type(self).__name__, digest, self.base_url)
+        if not refresh:
+            entry = _MODELS_CACHE.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                yield from entry[1]
+                return
+        models = []
+        for model in self._fetch_models():
+            models.append(model)
+            yield model
+        # Only a fully consumed enumeration is cached; an abandoned
+        # generator never reaches this line
+        _MODELS_CACHE[cache_key] = (time.monotonic() + _MODELS_TTL, models)
+
     @abstractmethod
-    def name(self) -> str:
-        """Provider name."""
+    def _fetch_models(self) -> Iterator[ModelInfo]:
+        """Yield available models from the provider as they are fetched."""
         pass
 
+    def validate_key(self, refresh: bool = False) -> bool:
+        """Validate the API key, caching successes for a few minutes.
+
+        Repeated validations of the same key within the TTL return the
+        cached result without a network round-trip. Only True results are
+        cached: _check_credentials returns False for transient failures
+        (timeouts, connection errors) too, and pinning those would report
+        a good key as invalid for the rest of the TTL. Keys are stored as
+        blake2b digests so the cache never retains the secret itself;
+        pass refresh=True to force a fresh probe.
+        """
+        cache_key = self._validation_cache_key()
+        if not refresh:
+            cached = _VALIDATION_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+        return self._store_validation(cache_key, self._check_credentials())
+
+    async def avalidate_key(self, refresh: bool = False) -> bool:
+        """Async variant of validate_key, sharing the same success cache.
+
+        Bulk runs go through this path exclusively, so duplicate keys in
+        one batch and back-to-back runs hit the cache instead of
+        re-issuing every probe.
+        """
+        cache_key = self._validation_cache_key()
+        if not refresh:
+            cached = _VALIDATION_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+        return self._store_validation(cache_key, await self._acheck_credentials())
+
+    def _validation_cache_key(self) -> tuple:
+        digest = hashlib.blake2b(self.api_key.encode(), digest_size=16).digest()
+        bucket = int(time.monotonic() // _VALIDATION_TTL)
+        return (type(self).__name__, digest, self.base_url, bucket)
+
+    @staticmethod
+    def _store_validation(cache_key: tuple, result: bool) -> bool:
+        if result:
+            if len(_VALIDATION_CACHE) > 4096:
+                _VALIDATION_CACHE.clear()
+            _VALIDATION_CACHE[cache_key] = result
+        return result
+
     @abstractmethod
-    def list_models(self) -> list[ModelInfo]:
-        """List all available models."""
+    def _check_credentials(self) -> bool:
+        """Issue a minimal authenticated request; True when auth works."""
         pass
 
     @abstractmethod
-    def validate_key(self) -> bool:
-        """Validate the API key by attempting to list models."""
+    async def _acheck_credentials(self) -> bool:
+        """Async variant of _check_credentials."""
         pass
 
     @abstractmethod
@@ -0,0 +1,151 @@
+"""Bulk, bounded-concurrency operations across providers."""
+
+import asyncio
+from typing import Optional, Union
+
+from .base import BaseProvider
+
+# Provider kind -> class name, resolved lazily through the package so a
+# batch over one kind only imports that SDK
+_PROVIDER_CLASSES = {
+    "openai": "OpenAIProvider",
+    "anthropic": "AnthropicProvider",
+    "gemini": "GeminiProvider",
+}
+
+
+def make_provider(kind: str, api_key: str, **options) -> BaseProvider:
+    """Build a provider instance from a kind name ("openai", ...)."""
+    class_name = _PROVIDER_CLASSES.get(kind)
+    if class_name is None:
+        raise ValueError(f"Unknown provider: {kind}")
+    import providers
+    return getattr(providers, class_name).get_instance(api_key=api_key, **options)
+
+
+async def validate_many(
+    items: list[tuple[str, str]],
+    max_concurrency: int = 50,
+) -> list[Union[bool, BaseException]]:
+    """Validate (kind, api_key) pairs concurrently.
+
+    Fan-out is capped by a semaphore so large batches don't open an
+    unbounded number of simultaneous requests. Results come back in input
+    order; a check that raised surfaces its exception in that slot.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def check(kind: str, api_key: str):
+        async with sem:
+            return await make_provider(kind, api_key).avalidate_key()
+
+    return await asyncio.gather(
+        *(check(kind, api_key) for kind, api_key in items),
+        return_exceptions=True,
+    )
+
+
+class BatchingExecutor:
+    """Coalesce concurrent chat prompts into fewer provider requests.
+
+    Prompts submitted within batch_window_ms of each other form one batch.
+    Identical (message, model, system_prompt) submissions in a batch are
+    served by a single n=K completion when the provider's async client
+    supports it (OpenAI); everything else fans out with asyncio.gather
+    over the shared keep-alive pool.
+    """
+
+    def __init__(self, provider: BaseProvider, batch_window_ms: float = 5.0):
+        self._provider = provider
+        self._window = batch_window_ms / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Queue a prompt and wait for its completion text."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((message, model, system_prompt), future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        """Collect submissions into windowed batches and run them."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            batch = [item]
+            while True:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=self._window)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch: list) -> None:
+        groups: dict[tuple, list[asyncio.Future]] = {}
+        for key, future in batch:
+            groups.setdefault(key, []).append(future)
+
+        async def run_group(key: tuple, futures: list[asyncio.Future]) -> None:
+            message, model, system_prompt = key
+            try:
+                texts = await self._complete_group(message, model, system_prompt, len(futures))
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for future, text in zip(futures, texts):
+                if not future.done():
+                    future.set_result(text)
+
+        await asyncio.gather(*(run_group(k, fs) for k, fs in groups.items()))
+
+    async def _complete_group(
+        self,
+        message: str,
+        model: Optional[str],
+        system_prompt: Optional[str],
+        count: int,
+    ) -> list[str]:
+        provider = self._provider
+        if count == 1:
+            return [await provider.achat(message, model=model, system_prompt=system_prompt)]
+
+        # K identical prompts collapse into one n=K request where the async
+        # client exposes chat completions; other providers gather K calls
+        aclient = getattr(provider, "aclient", None)
+        if aclient is not None and hasattr(aclient, "chat"):
+            final_model = model or provider.default_model
+            if not final_model:
+                raise ValueError("No model specified and no default model set")
+            messages = []
+            sp = system_prompt or provider.system_prompt
+            if sp:
+                messages.append({"role": "system", "content": sp})
+            messages.append({"role": "user", "content": message})
+            response = await aclient.chat.completions.create(
+                model=final_model,
+                messages=messages,
+                n=count,
+            )
+            texts = [choice.message.content or "" for choice in response.choices]
+            # Pad defensively if the API returned fewer choices than asked
+            while len(texts) < count:
+                texts.append(texts[-1] if texts else "")
+            return texts
+
+        results = await asyncio.gather(
+            *(provider.achat(message, model=model, system_prompt=system_prompt) for _ in range(count))
+        )
+        return list(results)
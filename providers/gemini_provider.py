@@ -1,13 +1,24 @@
-from typing import Optional, Generator
+from functools import cached_property
+from typing import AsyncIterator, ClassVar, Optional, Generator, Iterator
 
 from google import genai
+from google.genai import errors, types
 
+from ._http import SHARED_ASYNC_CLIENT, SHARED_HTTP_CLIENT
+from ._stream import pump
 from .base import BaseProvider, ModelInfo
 
 
 class GeminiProvider(BaseProvider):
     """Google Gemini API provider."""
 
+    name = "Gemini"
+    api_root = "https://generativelanguage.googleapis.com/"
+
+    # SDK clients shared per credentials, so repeated construction with the
+    # same key reuses the existing connection pool and TLS session
+    _client_cache: ClassVar[dict[str, genai.Client]] = {}
+
     def __init__(
         self,
         api_key: str,
@@ -16,36 +27,72 @@ class GeminiProvider(BaseProvider):
         default_model: Optional[str] = None,
     ):
         super().__init__(api_key, base_url, system_prompt, default_model)
-        self._client: Optional[genai.Client] = None
+        # Pre-rendered prompt prefix so chats that reuse the configured
+        # system prompt skip the per-call f-string build
+        self._sys_prefix = f"{system_prompt}\n\nUser: " if system_prompt else ""
 
-    @property
-    def name(self) -> str:
-        return "Gemini"
+    @cached_property
+    def client(self) -> genai.Client:
+        client = self._client_cache.get(self.api_key)
+        if client is None:
+            client = genai.Client(
+                api_key=self.api_key,
+                http_options=types.HttpOptions(
+                    httpx_client=SHARED_HTTP_CLIENT,
+                    httpx_async_client=SHARED_ASYNC_CLIENT,
+                ),
+            )
+            self._client_cache[self.api_key] = client
+        return client
 
     @property
-    def client(self) -> genai.Client:
-        if self._client is None:
-            self._client = genai.Client(api_key=self.api_key)
-        return self._client
-
-    def list_models(self) -> list[ModelInfo]:
-        """List all available models from Gemini."""
-        models = []
-        for model in self.client.models.list():
-            models.append(
-                ModelInfo(
-                    id=model.name if hasattr(model, "name") else str(model),
-                    name=model.display_name if hasattr(model, "display_name") else None,
-                    description=model.description if hasattr(model, "description") else None,
-                )
+    def aclient(self):
+        # google-genai exposes async operations on the same client via .aio
+        return self.client.aio
+
+    def _fetch_models(self) -> Iterator[ModelInfo]:
+        """Yield available models from Gemini as they are fetched."""
+        return (
+            ModelInfo(
+                id=getattr(model, "name", None) or str(model),
+                name=getattr(model, "display_name", None),
+                description=getattr(model, "description", None),
             )
-        return models
+            for model in self.client.models.list()
+        )
 
-    def validate_key(self) -> bool:
-        """Validate the API key by attempting to list models."""
+    async def alist_models(self) -> list[ModelInfo]:
+        """Async variant of list_models, returning the full list."""
+        return [
+            ModelInfo(
+                id=getattr(model, "name", None) or str(model),
+                name=getattr(model, "display_name", None),
+                description=getattr(model, "description", None),
+            )
+            async for model in await self.aclient.models.list()
+        ]
+
+    def _check_credentials(self) -> bool:
+        """Check the API key by fetching a single known model."""
         try:
-            self.list_models()
+            # A single-model GET is enough to exercise auth, without
+            # downloading the full model catalog
+            self.client.models.get(model="models/gemini-2.0-flash")
             return True
+        except errors.APIError as e:
+            # A 404 means the probe model was retired, not that the key is
+            # bad; auth itself worked
+            return e.code == 404
+        except Exception:
+            return False
+
+    async def _acheck_credentials(self) -> bool:
+        """Async variant of _check_credentials."""
+        try:
+            await self.aclient.models.get(model="models/gemini-2.0-flash")
+            return True
+        except errors.APIError as e:
+            return e.code == 404
         except Exception:
             return False
 
@@ -63,22 +110,22 @@ class GeminiProvider(BaseProvider):
         if not model:
             raise ValueError("No model specified and no default model set")
 
-        prompt = message
-        if system_prompt or self.system_prompt:
-            prompt = f"{system_prompt or self.system_prompt}\n\nUser: {message}"
+        if system_prompt:
+            # Per-call override takes the slow path
+            prompt = f"{system_prompt}\n\nUser: {message}"
+        elif self._sys_prefix:
+            prompt = self._sys_prefix + message
+        else:
+            prompt = message
 
         if stream:
             response = self.client.models.generate_content_stream(
                 model=model,
                 contents=prompt,
             )
-            content = ""
-            for chunk in response:
-                if chunk.text:
-                    chunk_content = chunk.text
-                    content += chunk_content
-                    yield chunk_content
-            return content
+            return (yield from pump(
+                chunk.text for chunk in response if chunk.text
+            ))
         else:
             response = self.client.models.generate_content(
                 model=model,
@@ -87,3 +134,53 @@ class GeminiProvider(BaseProvider):
             if response.text:
                 return response.text
             return ""
+
+    async def achat(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Async, non-streaming variant of chat."""
+        model = model or self.default_model
+        if not model:
+            raise ValueError("No model specified and no default model set")
+
+        if system_prompt:
+            prompt = f"{system_prompt}\n\nUser: {message}"
+        elif self._sys_prefix:
+            prompt = self._sys_prefix + message
+        else:
+            prompt = message
+
+        response = await self.aclient.models.generate_content(
+            model=model,
+            contents=prompt,
+        )
+        return response.text or ""
+
+    async def astream(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Async streaming variant of chat, yielding response deltas."""
+        model = model or self.default_model
+        if not model:
+            raise ValueError("No model specified and no default model set")
+
+        if system_prompt:
+            prompt = f"{system_prompt}\n\nUser: {message}"
+        elif self._sys_prefix:
+            prompt = self._sys_prefix + message
+        else:
+            prompt = message
+
+        response = await self.aclient.models.generate_content_stream(
+            model=model,
+            contents=prompt,
+        )
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
@@ -1,53 +1,100 @@
-from typing import Optional, Generator
+from functools import cached_property
+from typing import AsyncIterator, ClassVar, Optional, Generator, Iterator
 
-from openai import OpenAI
+from openai import AsyncOpenAI, AuthenticationError, NotFoundError, OpenAI
 
+from ._http import SHARED_ASYNC_CLIENT, SHARED_HTTP_CLIENT
+from ._json import loads as _loads
+from ._stream import pump
 from .base import BaseProvider, ModelInfo
 
 
 class OpenAIProvider(BaseProvider):
     """OpenAI API provider."""
 
+    name = "OpenAI"
+    api_root = "https://api.openai.com/v1/models"
+
+    # SDK clients shared per credentials, so repeated construction with the
+    # same key reuses the existing connection pool and TLS session
+    _client_cache: ClassVar[dict[tuple, OpenAI]] = {}
+    _aclient_cache: ClassVar[dict[tuple, AsyncOpenAI]] = {}
+
     def __init__(
         self,
         api_key: str,
         base_url: Optional[str] = None,
         system_prompt: Optional[str] = None,
         default_model: Optional[str] = None,
+        use_responses_api: bool = False,
     ):
         super().__init__(api_key, base_url, system_prompt, default_model)
-        self._client: Optional[OpenAI] = None
+        # Opt-in: route chat through the Responses API, which caches
+        # repeated instructions server-side and supports stateful turns
+        self.use_responses_api = use_responses_api
+        self._previous_response_id: Optional[str] = None
 
-    @property
-    def name(self) -> str:
-        return "OpenAI"
-
-    @property
+    @cached_property
     def client(self) -> OpenAI:
-        if self._client is None:
-            kwargs = {"api_key": self.api_key}
+        cache_key = (self.api_key, self.base_url)
+        client = self._client_cache.get(cache_key)
+        if client is None:
+            kwargs = {"api_key": self.api_key, "http_client": SHARED_HTTP_CLIENT}
+            if self.base_url:
+                kwargs["base_url"] = self.base_url
+            client = OpenAI(**kwargs)
+            self._client_cache[cache_key] = client
+        return client
+
+    @cached_property
+    def aclient(self) -> AsyncOpenAI:
+        cache_key = (self.api_key, self.base_url)
+        client = self._aclient_cache.get(cache_key)
+        if client is None:
+            kwargs = {"api_key": self.api_key, "http_client": SHARED_ASYNC_CLIENT}
             if self.base_url:
                 kwargs["base_url"] = self.base_url
-            self._client = OpenAI(**kwargs)
-        return self._client
+            client = AsyncOpenAI(**kwargs)
+            self._aclient_cache[cache_key] = client
+        return client
 
-    def list_models(self) -> list[ModelInfo]:
-        """List all available models from OpenAI."""
-        models = []
+    def _fetch_models(self) -> Iterator[ModelInfo]:
+        """Yield available models from OpenAI as they are fetched."""
         for model in self.client.models.list():
-            models.append(
-                ModelInfo(
-                    id=model.id,
-                    name=model.id,
-                    created=model.created,
-                )
+            yield ModelInfo(
+                id=model.id,
+                name=model.id,
+                created=model.created,
             )
-        return models
 
-    def validate_key(self) -> bool:
-        """Validate the API key by attempting to list models."""
+    async def alist_models(self) -> list[ModelInfo]:
+        """Async variant of list_models, returning the full list."""
+        return [
+            ModelInfo(id=model.id, name=model.id, created=model.created)
+            async for model in self.aclient.models.list()
+        ]
+
+    def _check_credentials(self) -> bool:
+        """Check the API key with a single-model retrieve."""
         try:
-            self.list_models()
+            self.client.models.retrieve("gpt-3.5-turbo")
+            return True
+        except AuthenticationError:
+            return False
+        except NotFoundError:
+            # The account just lacks this model; auth itself worked
+            return True
+        except Exception:
+            return False
+
+    async def _acheck_credentials(self) -> bool:
+        """Async variant of _check_credentials."""
+        try:
+            await self.aclient.models.retrieve("gpt-3.5-turbo")
+            return True
+        except AuthenticationError:
+            return False
+        except NotFoundError:
             return True
         except Exception:
             return False
@@ -66,6 +113,9 @@ class OpenAIProvider(BaseProvider):
         if not model:
             raise ValueError("No model specified and no default model set")
 
+        if self.use_responses_api:
+            return (yield from self._chat_responses(message, model, system_prompt, stream))
+
         # Build messages
         messages = []
         if system_prompt or self.system_prompt:
@@ -73,20 +123,14 @@ class OpenAIProvider(BaseProvider):
         messages.append({"role": "user", "content": message})
 
         if stream:
-            response = self.client.chat.completions.create(
+            # Read the raw SSE lines instead of letting the SDK validate a
+            # Pydantic ChatCompletionChunk per delta; we only need content
+            with self.client.chat.completions.with_streaming_response.create(
                 model=model,
                 messages=messages,
                 stream=True,
-            )
-            content = ""
-            for chunk in response:
-                if chunk.choices and len(chunk.choices) > 0:
-                    delta = chunk.choices[0].delta
-                    if delta and delta.content:
-                        chunk_content = delta.content
-                        content += chunk_content
-                        yield chunk_content
-            return content
+            ) as response:
+                return (yield from pump(self._iter_sse_deltas(response)))
         else:
             response = self.client.chat.completions.create(
                 model=model,
@@ -96,3 +140,113 @@ class OpenAIProvider(BaseProvider):
             if response.choices and len(response.choices) > 0:
                 return response.choices[0].message.content or ""
             return ""
+
+    def _chat_responses(
+        self,
+        message: str,
+        model: str,
+        system_prompt: Optional[str],
+        stream: bool,
+    ) -> Generator[str, None, str]:
+        """Chat through the Responses API.
+
+        Instructions ride in their own field (eligible for server-side
+        prompt caching) and the previous response id carries conversation
+        state across turns on this instance.
+        """
+        kwargs = {"model": model, "input": message}
+        sp = system_prompt or self.system_prompt
+        if sp:
+            kwargs["instructions"] = sp
+        if self._previous_response_id:
+            kwargs["previous_response_id"] = self._previous_response_id
+
+        if stream:
+            parts = []
+            for event in self.client.responses.create(stream=True, **kwargs):
+                event_type = getattr(event, "type", "")
+                if event_type == "response.output_text.delta":
+                    parts.append(event.delta)
+                    yield event.delta
+                elif event_type == "response.completed":
+                    self._previous_response_id = event.response.id
+            return "".join(parts)
+        else:
+            response = self.client.responses.create(**kwargs)
+            self._previous_response_id = response.id
+            return response.output_text or ""
+
+    @staticmethod
+    def _iter_sse_deltas(response) -> Iterator[str]:
+        """Yield content deltas from a raw chat-completions SSE response."""
+        for line in response.iter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            # The SDK guarantees the shape; catching the rare miss is
+            # cheaper than guarding every level on every chunk. TypeError
+            # covers nulls ("delta": null) from OpenAI-compatible proxies
+            try:
+                chunk_content = _loads(data)["choices"][0]["delta"]["content"]
+            except (KeyError, IndexError, TypeError):
+                continue
+            if chunk_content:
+                yield chunk_content
+
+    async def achat(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Async, non-streaming variant of chat."""
+        model = model or self.default_model
+        if not model:
+            raise ValueError("No model specified and no default model set")
+
+        # Build messages
+        messages = []
+        if system_prompt or self.system_prompt:
+            messages.append({"role": "system", "content": system_prompt or self.system_prompt})
+        messages.append({"role": "user", "content": message})
+
+        response = await self.aclient.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=False,
+        )
+        if response.choices and len(response.choices) > 0:
+            return response.choices[0].message.content or ""
+        return ""
+
+    async def astream(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Async streaming variant of chat, yielding response deltas."""
+        model = model or self.default_model
+        if not model:
+            raise ValueError("No model specified and no default model set")
+
+        # Build messages
+        messages = []
+        if system_prompt or self.system_prompt:
+            messages.append({"role": "system", "content": system_prompt or self.system_prompt})
+        messages.append({"role": "user", "content": message})
+
+        stream = await self.aclient.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True,
+        )
+        async for chunk in stream:
+            try:
+                content = chunk.choices[0].delta.content
+            except (IndexError, AttributeError, TypeError):
+                continue
+            if content:
+                yield content